@@ -1,5 +1,10 @@
+import atexit
+import functools
+import io
 import os
+import shlex
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import random
 import math
@@ -8,13 +13,38 @@ import time
 import json
 import re
 import sys
-from multiprocessing import Queue
+from multiprocessing import Process, Queue
 from flask import Flask
 
 # Глобальные переменные для статистики
 total_commits = 0          # Общее число успешных пушей (коммитов)
 file_commit_counts = {}    # Статистика коммитов по файлам
 
+# Расширения файлов, в которые вносятся изменения (frozenset — O(1) проверка)
+SUPPORTED_EXTS = frozenset({'.py', '.sql', '.cpp', '.hpp', '.cxx', '.h', '.kt', '.kts', '.swift'})
+
+# Соответствие расширений файлов языкам программирования
+_EXT_TO_LANG = {
+    '.py': 'python',
+    '.sql': 'sql',
+    '.cpp': 'cpp',
+    '.hpp': 'cpp',
+    '.cxx': 'cpp',
+    '.h': 'cpp',
+    '.kt': 'kotlin',
+    '.kts': 'kotlin',
+    '.swift': 'swift'
+}
+
+# Кэш списка файлов по репозиториям (заполняется один раз за сессию)
+_repo_file_cache = {}
+
+# Скомпилированные шаблоны для оценки сложности кода
+_RE_FUNC = re.compile(r'def\s+\w+\s*\(')
+_RE_CLASS = re.compile(r'class\s+\w+\s*[:\(]')
+_RE_COND = re.compile(r'\s+if\s+')
+_RE_LOOP = re.compile(r'\s+(for|while)\s+')
+
 def setup_logging():
     """
     Настраивает систему логирования
@@ -28,36 +58,29 @@ def setup_logging():
         ]
     )
 
+# Профессиональные комментарии по языкам программирования
+_COMMENTS = {
+    "python": "# Refactored function for better performance",
+    "sql": "-- Optimized query for faster response",
+    "cpp": "// Improved memory management in loop",
+    "kotlin": "// Enhanced null-safety check",
+    "swift": "// Updated UI component initialization"
+}
+
 def get_comment(language):
     """
     Возвращает профессиональный комментарий для данного языка программирования.
     """
-    comments = {
-        "python": "# Refactored function for better performance",
-        "sql": "-- Optimized query for faster response",
-        "cpp": "// Improved memory management in loop",
-        "kotlin": "// Enhanced null-safety check",
-        "swift": "// Updated UI component initialization"
-    }
-    return comments.get(language, "# General update")
+    return _COMMENTS.get(language, "# General update")
 
+@functools.lru_cache(maxsize=4096)
 def get_language(file_path):
     """
     Определяет язык программирования файла по его расширению.
+    Результат кэшируется: набор файлов за сессию ограничен, и повторные
+    вызовы для того же пути не выполняют строковые операции заново.
     """
-    extension = os.path.splitext(file_path)[1].lower()
-    if extension == ".py":
-        return "python"
-    elif extension == ".sql":
-        return "sql"
-    elif extension in [".cpp", ".hpp", ".cxx", ".h"]:
-        return "cpp"
-    elif extension in [".kt", ".kts"]:
-        return "kotlin"
-    elif extension == ".swift":
-        return "swift"
-    else:
-        return "unknown"
+    return _EXT_TO_LANG.get(os.path.splitext(file_path)[1].lower(), "unknown")
 
 def make_minimal_change(file_path, language):
     """
@@ -68,21 +91,15 @@ def make_minimal_change(file_path, language):
         return False
 
     try:
-        with open(file_path, 'r') as f:
-            content = f.readlines()
-
         # Гарантированно вносим изменения
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         comment = get_comment(language)
-        
-        # Добавляем комментарий в случайное место файла
-        insert_position = random.randint(0, max(len(content), 1))
-        content.insert(insert_position, f"\n{comment} - {timestamp}\n")
-        
-        # Сохраняем изменения
-        with open(file_path, 'w') as f:
-            f.writelines(content)
-        
+
+        # Дописываем комментарий в конец файла: O(1) от размера файла,
+        # без чтения и перезаписи всего содержимого
+        with open(file_path, 'a') as f:
+            f.write(f"\n{comment} - {timestamp}\n")
+
         logging.info(f"Внесено изменение в файл: {file_path}")
         return True
     except Exception as e:
@@ -100,21 +117,26 @@ def check_access(repo_path):
     Проверяет доступность репозитория для пуша с использованием команды git push --dry-run.
     """
     try:
+        # stdout никогда не читается — отправляем его в DEVNULL вместо
+        # буферизации в памяти; stderr оставляем для сообщения об ошибке
         subprocess.run(
             ["git", "push", "--dry-run"],
             check=True,
             cwd=repo_path,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True
         )
         return True
     except subprocess.CalledProcessError as e:
-        logging.error(f"Проблема доступа в репозитории {repo_path}: {e}")
+        logging.error(f"Проблема доступа в репозитории {repo_path}: {e.stderr or e}")
         return False
 
-def git_commit(repo_path, commit_message=None):
+def git_make_commit(repo_path, commit_message=None):
     """
-    Вносит изменение в **один** файл, выполняет git add, commit и push в указанном репозитории.
+    Вносит изменение в **один** файл и выполняет git add и commit (без push).
+    Push выполняется отдельно через git_flush, чтобы отправить все коммиты
+    репозитория одним сетевым запросом.
     Возвращает словарь с информацией о том, какой файл был изменён.
     Если коммит не удался, возвращает False.
     """
@@ -122,17 +144,23 @@ def git_commit(repo_path, commit_message=None):
         logging.error(f"Репозиторий {repo_path} не найден!")
         return False
 
-    # Переходим в директорию репозитория
-    os.chdir(repo_path)
+    # Составляем список файлов с поддерживаемыми расширениями.
+    # Вместо обхода дерева через os.walk используем один вызов 'git ls-files'
+    # (учитывает .gitignore) и кэшируем результат на всю сессию.
+    if repo_path not in _repo_file_cache:
+        result = subprocess.run(
+            ["git", "ls-files"],
+            cwd=repo_path,
+            capture_output=True,
+            text=True
+        )
+        _repo_file_cache[repo_path] = [
+            os.path.join(repo_path, f)
+            for f in result.stdout.splitlines()
+            if os.path.splitext(f)[1].lower() in SUPPORTED_EXTS
+        ]
+    repo_files = _repo_file_cache[repo_path]
 
-    # Составляем список файлов с поддерживаемыми расширениями (рекурсивно)
-    supported_exts = ['.py', '.sql', '.cpp', '.hpp', '.cxx', '.h', '.kt', '.kts', '.swift']
-    repo_files = []
-    for root, dirs, files in os.walk(repo_path):
-        for file in files:
-            if os.path.splitext(file)[1].lower() in supported_exts:
-                repo_files.append(os.path.join(root, file))
-    
     if not repo_files:
         logging.error("Нет файлов с поддерживаемыми расширениями для изменений!")
         return False
@@ -142,42 +170,142 @@ def git_commit(repo_path, commit_message=None):
     make_minimal_change(file_to_change, get_language(file_to_change))
     local_commit_files = {file_to_change: 1}
 
-    # Добавляем изменения в индекс
-    try:
-        subprocess.run(["git", "add", "."], check=True)
-        logging.info("Изменения добавлены в индекс.")
-    except subprocess.CalledProcessError as e:
-        logging.error(f"Ошибка при выполнении 'git add': {e}")
-        return False
-
     # Формируем сообщение для коммита, если не задано
     if commit_message is None:
         commit_message = f"Auto-commit: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
 
-    # Создаём коммит
+    # Выполняем add и commit одной командой оболочки:
+    # один запуск процесса вместо двух снижает накладные расходы на fork/exec
     try:
-        subprocess.run(["git", "commit", "-m", commit_message], check=True)
+        subprocess.run(
+            f"git add . && git commit -m {shlex.quote(commit_message)}",
+            shell=True,
+            cwd=repo_path,
+            check=True,
+            capture_output=True,
+            text=True
+        )
         logging.info(f"Коммит выполнен: {commit_message}")
     except subprocess.CalledProcessError as e:
-        logging.error(f"Нечего коммитить в репозитории {repo_path}: {e}")
+        # Определяем по выводу, на каком шаге произошла ошибка:
+        # "nothing to commit" git печатает в stdout, а не в stderr
+        output = (e.stdout or "") + (e.stderr or "")
+        if "commit" in output or "nothing to commit" in output:
+            logging.error(f"Нечего коммитить в репозитории {repo_path}: {e}")
+        else:
+            logging.error(f"Ошибка при выполнении 'git add' в репозитории {repo_path}: {e}")
         return False
 
-    # Пушим изменения в удалённый репозиторий
+    # Возвращаем информацию о файле, затронутом в этом коммите
+    return local_commit_files
+
+# Фоновый пул для неблокирующего push: локальные коммиты продолжаются,
+# пока предыдущие push выполняются по сети
+_push_executor = ThreadPoolExecutor(max_workers=4)
+_push_futures = []
+
+def _drain_push_futures():
+    """Дожидается завершения всех фоновых push (вызывается при выходе)."""
+    for future in _push_futures:
+        try:
+            future.result()
+        except subprocess.CalledProcessError as e:
+            logging.error(f"Фоновый 'git push' завершился с ошибкой: {e}")
+    _push_futures.clear()
+
+atexit.register(_drain_push_futures)
+
+def _git_push(repo_path):
+    """Выполняет 'git push' и логирует результат."""
     try:
-        subprocess.run(["git", "push"], check=True)
-        logging.info("Изменения отправлены в удалённый репозиторий.")
+        subprocess.run(
+            ["git", "push"],
+            cwd=repo_path,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+        logging.info(f"Все коммиты репозитория {repo_path} отправлены в удалённый репозиторий.")
+        return True
     except subprocess.CalledProcessError as e:
-        logging.error(f"Ошибка при выполнении 'git push' в репозитории {repo_path}: {e}")
+        logging.error(f"Ошибка при выполнении 'git push' в репозитории {repo_path}: {e.stderr or e}")
         return False
 
-    # Возвращаем информацию о файле, затронутом в этом коммите
-    return local_commit_files
+def git_flush(repo_path, blocking=False):
+    """
+    Отправляет все накопленные локальные коммиты репозитория одним 'git push'.
+    По умолчанию push ставится в фоновый пул и не блокирует цикл коммитов;
+    при blocking=True результат push возвращается синхронно.
+    """
+    if blocking:
+        return _git_push(repo_path)
+    _push_futures.append(_push_executor.submit(_git_push, repo_path))
+    return True
+
+class GitSession:
+    """
+    Долгоживущий процесс 'git cat-file --batch-check' для одного репозитория.
+    Позволяет разрешать ссылки (например, HEAD~N) через stdin/stdout
+    без запуска нового git-процесса на каждую операцию.
+    """
+    def __init__(self, repo_path):
+        self.repo_path = repo_path
+        self.proc = subprocess.Popen(
+            ["git", "cat-file", "--batch-check"],
+            cwd=repo_path,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True
+        )
+
+    def resolve(self, ref):
+        """Возвращает хеш объекта для ссылки или None, если объект не найден."""
+        try:
+            self.proc.stdin.write(f"{ref}\n")
+            self.proc.stdin.flush()
+            line = self.proc.stdout.readline().strip()
+        except OSError as e:
+            # Фоновый процесс мог завершиться (BrokenPipeError и т.п.) —
+            # ведём себя как неудачный 'git rev-parse', а не падаем
+            logging.error(f"Git-сессия репозитория {self.repo_path} недоступна: {e}")
+            return None
+        if not line or line.endswith("missing"):
+            return None
+        return line.split()[0]
+
+    def close(self):
+        """Завершает фоновый git-процесс."""
+        if self.proc.poll() is None:
+            try:
+                self.proc.stdin.close()
+            except OSError:
+                pass
+            self.proc.wait()
+
+# Сессии git по репозиториям (одна на репозиторий за сессию работы)
+_git_sessions = {}
+
+def _get_git_session(repo_path):
+    """Возвращает (создавая при необходимости) GitSession для репозитория."""
+    if repo_path not in _git_sessions:
+        _git_sessions[repo_path] = GitSession(repo_path)
+    return _git_sessions[repo_path]
+
+def _close_git_sessions():
+    """Закрывает все открытые git-сессии (вызывается при выходе)."""
+    for session in _git_sessions.values():
+        session.close()
+    _git_sessions.clear()
+
+atexit.register(_close_git_sessions)
 
 class RepositoryStatistics:
     def __init__(self):
         self.stats_file = 'repository_stats.json'
+        self._dirty = False
         self.load_stats()
-        
+
     def load_stats(self):
         """Загружает статистику из файла"""
         try:
@@ -202,7 +330,13 @@ class RepositoryStatistics:
         """Сохраняет статистику в файл"""
         with open(self.stats_file, 'w') as f:
             json.dump(self.stats, f, indent=4)
-    
+
+    def flush(self):
+        """Сбрасывает накопленную статистику на диск, если были изменения"""
+        if self._dirty:
+            self.save_stats()
+            self._dirty = False
+
     def add_commit(self, repo_path, file_path, commit_type, timestamp):
         """Добавляет информацию о коммите в статистику"""
         # Статистика по репозиторию
@@ -233,20 +367,22 @@ class RepositoryStatistics:
         file_stats['commits'] += 1
         file_stats['last_modified'] = timestamp
         
-        # Обновляем статистику по времени
-        commit_hour = datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S').hour
-        commit_day = datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S').weekday()
-        repo_stats['active_hours'][commit_hour] += 1
-        repo_stats['active_days'][commit_day] += 1
-        
+        # Обновляем статистику по времени (строка разбирается один раз,
+        # дальше используется объект datetime)
+        dt = datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S')
+        repo_stats['active_hours'][dt.hour] += 1
+        repo_stats['active_days'][dt.weekday()] += 1
+
         # Обновляем общую статистику
+        # Не пишем файл на каждом коммите: полная сериализация растущего
+        # словаря на диск выполняется один раз в flush() в конце сессии
         self.stats['total_commits'] += 1
-        self.update_commit_streak(timestamp)
-        self.save_stats()
+        self.update_commit_streak(dt)
+        self._dirty = True
 
-    def update_commit_streak(self, timestamp):
+    def update_commit_streak(self, dt):
         """Обновляет статистику по сериям коммитов"""
-        current_date = datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S').date()
+        current_date = dt.date()
         last_date = None
         
         if self.stats['commit_streaks']['last_commit_date']:
@@ -273,59 +409,65 @@ class RepositoryStatistics:
     def calculate_file_complexity(self, file_path):
         """Рассчитывает сложность файла на основе его содержимого"""
         try:
+            # Простой алгоритм оценки сложности: один построчный проход
+            # по файлу (O(1) памяти) вместо загрузки всего содержимого
+            # и пяти отдельных проходов регулярных выражений
+            lines = functions = classes = conditionals = loops = 0
             with open(file_path, 'r') as f:
-                content = f.read()
-                
-            # Простой алгоритм оценки сложности
-            complexity = {
-                'lines': len(content.splitlines()),
-                'functions': len(re.findall(r'def\s+\w+\s*\(', content)),
-                'classes': len(re.findall(r'class\s+\w+\s*[:\(]', content)),
-                'conditionals': len(re.findall(r'\s+if\s+', content)),
-                'loops': len(re.findall(r'\s+(for|while)\s+', content))
-            }
-            
+                for line in f:
+                    lines += 1
+                    if _RE_FUNC.search(line):
+                        functions += 1
+                    if _RE_CLASS.search(line):
+                        classes += 1
+                    if _RE_COND.search(line):
+                        conditionals += 1
+                    if _RE_LOOP.search(line):
+                        loops += 1
+
             # Вычисляем общий счет сложности
             score = (
-                complexity['lines'] * 0.1 +
-                complexity['functions'] * 2 +
-                complexity['classes'] * 3 +
-                complexity['conditionals'] * 1.5 +
-                complexity['loops'] * 2
+                lines * 0.1 +
+                functions * 2 +
+                classes * 3 +
+                conditionals * 1.5 +
+                loops * 2
             )
-            
+
             return score
         except Exception:
             return 0
 
     def generate_report(self):
         """Генерирует подробный отчет о статистике"""
-        report = []
-        report.append("\n=== Общая статистика ===")
-        report.append(f"Всего коммитов: {self.stats['total_commits']}")
-        report.append(f"Текущая серия коммитов: {self.stats['commit_streaks']['current']}")
-        report.append(f"Самая длинная серия: {self.stats['commit_streaks']['longest']}")
-        
-        report.append("\n=== Статистика по репозиториям ===")
+        # Пишем сразу в строковый буфер вместо списка строк с финальным join
+        buf = io.StringIO()
+        w = buf.write
+        w("\n=== Общая статистика ===")
+        w(f"\nВсего коммитов: {self.stats['total_commits']}")
+        w(f"\nТекущая серия коммитов: {self.stats['commit_streaks']['current']}")
+        w(f"\nСамая длинная серия: {self.stats['commit_streaks']['longest']}")
+
+        w("\n\n=== Статистика по репозиториям ===")
         for repo_path, repo_stats in self.stats['repositories'].items():
-            report.append(f"\nРепозиторий: {repo_path}")
-            report.append(f"Всего коммитов: {repo_stats['total_commits']}")
-            report.append(f"Последний коммит: {repo_stats['last_commit']}")
-            
+            w(f"\n\nРепозиторий: {repo_path}")
+            w(f"\nВсего коммитов: {repo_stats['total_commits']}")
+            w(f"\nПоследний коммит: {repo_stats['last_commit']}")
+
             # Анализ активности по времени
             peak_hour = repo_stats['active_hours'].index(max(repo_stats['active_hours']))
             peak_day = repo_stats['active_days'].index(max(repo_stats['active_days']))
             days = ['Пн', 'Вт', 'Ср', 'Чт', 'Пт', 'Сб', 'Вс']
-            report.append(f"Пик активности: {peak_hour}:00, {days[peak_day]}")
-            
-            report.append("\nСтатистика по файлам:")
+            w(f"\nПик активности: {peak_hour}:00, {days[peak_day]}")
+
+            w("\n\nСтатистика по файлам:")
             for file_path, file_stats in repo_stats['files'].items():
-                report.append(f"\n  {file_path}")
-                report.append(f"  Коммитов: {file_stats['commits']}")
-                report.append(f"  Последнее изменение: {file_stats['last_modified']}")
-                report.append(f"  Сложность кода: {file_stats['complexity_score']:.2f}")
-        
-        return "\n".join(report)
+                w(f"\n\n  {file_path}")
+                w(f"\n  Коммитов: {file_stats['commits']}")
+                w(f"\n  Последнее изменение: {file_stats['last_modified']}")
+                w(f"\n  Сложность кода: {file_stats['complexity_score']:.2f}")
+
+        return buf.getvalue()
 
 def load_commit_templates():
     """Загружает шаблоны коммитов из файла"""
@@ -624,13 +766,11 @@ def reset_changes(repo_path):
     """
     try:
         # Получаем хеш последнего коммита перед нашими изменениями
-        last_commit = subprocess.run(
-            ["git", "rev-parse", "HEAD~" + str(changes_made)],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            check=True
-        ).stdout.strip()
+        # через постоянную git-сессию вместо запуска 'git rev-parse'
+        last_commit = _get_git_session(repo_path).resolve(f"HEAD~{changes_made}")
+        if last_commit is None:
+            logging.error(f"Не удалось найти коммит HEAD~{changes_made} в репозитории {repo_path}")
+            return False
 
         # Возвращаемся к предыдущему состоянию
         subprocess.run(["git", "reset", "--hard", last_commit], cwd=repo_path, check=True)
@@ -644,14 +784,92 @@ def reset_changes(repo_path):
         logging.error(f"Ошибка при сбросе изменений в репозитории {repo_path}: {e}")
         return False
 
-def process_repositories(repositories):
+def _process_one_repo(job):
+    """
+    Обрабатывает один репозиторий в отдельном процессе пула: выполняет
+    серию локальных коммитов и один push. Репозитории независимы
+    (разные рабочие директории и remote), поэтому обрабатываются параллельно.
+    Возвращает (repo_path, число коммитов, успешность push).
+    """
+    repo_path, commits_this_repo = job
+    commits_done = 0
+
+    # Генерируем типы изменений и сообщения для всей серии заранее:
+    # один вызов random.choices вместо random.choice на каждой итерации
+    change_types = random.choices(['feature', 'fix', 'refactor', 'docs', 'test'], k=commits_this_repo)
+    commit_messages = [get_realistic_commit_message(repo_path, change_type) for change_type in change_types]
+
+    for j, commit_message in enumerate(commit_messages):
+        local_commit_files = git_make_commit(repo_path, commit_message)
+        if local_commit_files:
+            commits_done += 1
+            logging.info(f"Успешно выполнен коммит {commits_done} в репозитории {repo_path}")
+        else:
+            logging.error(f"Не удалось выполнить коммит {j+1} в репозитории {repo_path}")
+            break
+
+    # Отправляем всю серию коммитов репозитория одним push.
+    # Здесь push блокирующий: перед предложением отката нужно знать,
+    # дошли ли коммиты до удалённого репозитория
+    pushed = git_flush(repo_path, blocking=True) if commits_done else False
+    return repo_path, commits_done, pushed
+
+def _commit_worker(send_q, recv_q):
+    """
+    Воркер: берёт задачи (repo_path, число коммитов) из очереди задач,
+    обрабатывает репозиторий и кладёт результат в очередь результатов.
+    Останавливается, получив сентинел 'STOP'.
+    """
+    # При методе запуска 'spawn' (по умолчанию на macOS) воркер стартует
+    # с чистым интерпретатором без настроенного логирования — без этого
+    # вызова все сообщения о ходе коммитов молча терялись бы
+    setup_logging()
+    # При fork (по умолчанию на Linux) воркеры наследуют состояние
+    # генератора случайных чисел родителя и без пересева выдавали бы
+    # одинаковые файлы и сообщения коммитов во всех репозиториях
+    random.seed()
+    for job in iter(send_q.get, 'STOP'):
+        try:
+            recv_q.put(_process_one_repo(job))
+        except Exception as e:
+            # Любая необработанная ошибка (например, OSError из subprocess)
+            # не должна убивать воркера молча: иначе главный процесс
+            # навсегда зависнет на recv_q.get() в ожидании результата
+            logging.error(f"Ошибка воркера при обработке репозитория {job[0]}: {e}")
+            recv_q.put((job[0], 0, False))
+
+def _run_commit_jobs(jobs):
+    """
+    Распределяет задачи (repo_path, число коммитов) между воркерами через
+    очереди. Воркеры разбирают задачи по мере освобождения, поэтому
+    репозитории с длинными сериями коммитов не блокируют короткие.
+    Возвращает список результатов _process_one_repo.
+    """
+    send_q, recv_q = Queue(), Queue()
+    workers = [
+        Process(target=_commit_worker, args=(send_q, recv_q))
+        for _ in range(min(len(jobs), os.cpu_count() or 1))
+    ]
+    for worker in workers:
+        worker.start()
+
+    for job in jobs:
+        send_q.put(job)
+    for _ in workers:
+        send_q.put('STOP')
+
+    results = [recv_q.get() for _ in jobs]
+    for worker in workers:
+        worker.join()
+    return results
+
+def process_repositories(repositories, stats):
     """
     Обрабатывает список репозиториев и ведет статистику
     """
-    stats = RepositoryStatistics()
     global total_commits, file_commit_counts, changes_made
     changes_made = 0
-    processed_repos = []  # Список обработанных репозиториев
+    processed_repos = set()  # Множество обработанных репозиториев
 
     # Проверка доступа для каждого репозитория
     available_repos = []
@@ -677,6 +895,8 @@ def process_repositories(repositories):
         for repo in selected_repos:
             logging.info(f"Выбран репозиторий: {repo}")
             
+        # Распределяем общее количество коммитов по репозиториям
+        jobs = []
         remaining_commits = total_commit_input
         for i, repo_path in enumerate(selected_repos):
             if i == len(selected_repos) - 1:
@@ -689,21 +909,8 @@ def process_repositories(repositories):
                 remaining_commits -= commits_this_repo
 
             logging.info(f"\nОбрабатывается репозиторий: {repo_path} с количеством коммитов: {commits_this_repo}")
-            
-            # Делаем коммиты без вопроса о сохранении
-            for j in range(commits_this_repo):
-                change_type = random.choice(['feature', 'fix', 'refactor', 'docs', 'test'])
-                commit_message = get_realistic_commit_message(repo_path, change_type)
-                
-                local_commit_files = git_commit(repo_path, commit_message)
-                if local_commit_files:
-                    changes_made += 1
-                    processed_repos.append(repo_path)
-                    logging.info(f"Успешно выполнен коммит {changes_made}")
-                else:
-                    logging.error(f"Не удалось выполнить коммит {j+1}")
-                    break
-            
+            jobs.append((repo_path, commits_this_repo))
+
     else:
         num_repos = random.randint(1, len(available_repos))
         selected_repos = random.sample(available_repos, num_repos)
@@ -712,23 +919,21 @@ def process_repositories(repositories):
         for repo in selected_repos:
             logging.info(f"Выбран репозиторий: {repo}")
             
+        jobs = []
         for repo_path in selected_repos:
             commit_count_local = calculate_commits()
             logging.info(f"\nОбрабатывается репозиторий: {repo_path} с количеством коммитов: {commit_count_local}")
-            
-            # Делаем коммиты без вопроса о сохранении
-            for i in range(commit_count_local):
-                change_type = random.choice(['feature', 'fix', 'refactor', 'docs', 'test'])
-                commit_message = get_realistic_commit_message(repo_path, change_type)
-                
-                local_commit_files = git_commit(repo_path, commit_message)
-                if local_commit_files:
-                    changes_made += 1
-                    processed_repos.append(repo_path)
-                    logging.info(f"Успешно выполнен коммит {changes_made}")
-                else:
-                    logging.error(f"Не удалось выполнить коммит {i+1}")
-                    break
+            jobs.append((repo_path, commit_count_local))
+
+    # Обрабатываем репозитории параллельно: узкое место — сетевой push,
+    # поэтому ускорение почти линейно по числу репозиториев
+    for repo_path, commits_done, pushed in _run_commit_jobs(jobs):
+        if pushed:
+            changes_made += commits_done
+            processed_repos.add(repo_path)
+            logging.info(f"Репозиторий {repo_path}: выполнено коммитов: {commits_done}")
+        elif commits_done:
+            logging.error(f"Не удалось отправить {commits_done} коммит(ов) репозитория {repo_path}")
 
     # После всех коммитов спрашиваем один раз о сохранении
     if changes_made > 0:
@@ -736,7 +941,7 @@ def process_repositories(repositories):
         
         if keep_changes != 'да':
             # Откатываем изменения во всех репозиториях
-            for repo_path in set(processed_repos):  # используем set для уникальных репозиториев
+            for repo_path in processed_repos:
                 if reset_changes(repo_path):
                     logging.info(f"Изменения в репозитории {repo_path} успешно отменены")
                 else:
@@ -745,6 +950,9 @@ def process_repositories(repositories):
         else:
             total_commits = changes_made
 
+    # Сбрасываем накопленную статистику на диск один раз за сессию
+    stats.flush()
+
     # Вывод итоговой статистики
     logging.info("\nСтатистика коммитов по файлам:")
     for file_path, count in file_commit_counts.items():
@@ -761,9 +969,13 @@ def main():
         "/Users/s2xdeb/Desktop/ed_g/pythhon"
     ]
     
+    # Статистика создаётся один раз: повторное создание перечитывало бы
+    # и заново разбирало JSON-файл на каждом действии меню
+    stats = RepositoryStatistics()
+
     while True:  # Бесконечный цикл для повторного запуска
-        process_repositories(repositories)
-        
+        process_repositories(repositories, stats)
+
         print("\nВыберите действие:")
         print("1. Показать статистику")
         print("2. Начать новую сессию")
@@ -772,7 +984,6 @@ def main():
         choice = input("Ваш выбор: ").strip()
         
         if choice == "1":
-            stats = RepositoryStatistics()
             print(stats.generate_report())
         elif choice == "2":
             continue  # Продолжаем цикл, начиная новую сессию